@@ -5,9 +5,50 @@ Purpose:    Implements a utility for administering the JSON pointer standard (IE
             defined at https://tools.ietf.org/html/rfc6901
 """
 
+import re
 from urllib import unquote
 
 
+#########################
+#
+# String Constants
+#
+#########################
+_SLASH = '/'
+_TILDE = '~'
+_EMPTY_STR = ''
+_ESCAPED_SLASH = '~1'
+_ESCAPED_TILDE = '~0'
+_DASH = '-'
+_ZERO = '0'
+_PERCENT = '%'
+
+#########################
+#
+# Array Index Handling
+#
+#########################
+_ARRAY_INDEX_RE = re.compile(r'(?:0|[1-9][0-9]*)\Z')
+
+#########################
+#
+# Pointer Cache
+#
+#########################
+_POINTER_CACHE = {}
+_POINTER_CACHE_SIZE = 1024
+
+#########################
+#
+# Evaluator Compilation
+#
+#########################
+# Number of evaluations after which a pointer is considered hot enough to compile
+_COMPILE_THRESHOLD = 2
+# Errors raised by a compiled evaluator when the pointer does not resolve
+_LOOKUP_ERRORS = (LookupError, TypeError, ValueError)
+
+
 #########################
 #
 # Convenience Functions
@@ -32,8 +73,8 @@ def evaluate(pointer, obj):
         a specific attribute from a JSON-style dictionary.
     :type pointer: str
 
-    :param obj: A dict of key/value pairs.
-    :type obj: dict
+    :param obj: A JSON-style object, such as a dict of key/value pairs or a list.
+    :type obj: dict or list
 
     :return: The attribute specified by the path attribute, or None if it doesn't exist.
     :rtype: any
@@ -41,7 +82,35 @@ def evaluate(pointer, obj):
     :raises JsonPointerException: When the specified JSON pointer path does not resolve, either because the
         path does not exist within the dict or an out of bounds array index is specified.
     """
-    return JsonPointer(pointer).evaluate(obj)
+    return _get_pointer(pointer).evaluate(obj)
+
+
+def _get_pointer(pointer):
+    """
+    Retrieves the JsonPointer for param pointer, reusing a previously parsed instance when one exists.
+    Once the cache holds _POINTER_CACHE_SIZE pointers, an arbitrary one is evicted to make room.
+
+    The cached instances are never handed out of this module, so they cannot be moved by callers.
+
+    :param pointer: The JSON Pointer string used to instantiate the JsonPointer object.
+    :type pointer: str
+
+    :return: The JsonPointer instance for param pointer.
+    :rtype: JsonPointer
+
+    :raises JsonPointerException: If param pointer is not a valid JSON pointer string.
+    """
+    if not isinstance(pointer, str):
+        return JsonPointer(pointer)
+
+    json_pointer = _POINTER_CACHE.get(pointer)
+    if json_pointer is None:
+        json_pointer = JsonPointer(pointer)
+        if len(_POINTER_CACHE) >= _POINTER_CACHE_SIZE:
+            _POINTER_CACHE.popitem()
+        _POINTER_CACHE[pointer] = json_pointer
+
+    return json_pointer
 
 
 #########################
@@ -51,19 +120,6 @@ def evaluate(pointer, obj):
 #########################
 class JsonPointer(object):
 
-    #########################
-    #
-    # String Constants
-    #
-    #########################
-    __SLASH = '/'
-    __TILDE = '~'
-    __EMPTY_STR = ''
-    __ESCAPED_SLASH = '~1'
-    __ESCAPED_TILDE = '~0'
-    __DASH = '-'
-    __ZERO = '0'
-
     def __init__(self, pointer):
         """
         Creates a new JsonPointer instance based on param pointer.
@@ -72,11 +128,23 @@ class JsonPointer(object):
         :type pointer: str
         """
         self.__validate_pointer(pointer)
-        self.__pieces = pointer.split(self.__SLASH)[1:]
+        # Validation guarantees a non-empty pointer starts with a slash, so drop it before splitting.
+        # Pieces are stored as a tuple until the pointer is first moved, when they become a list.
+        self.__pieces = tuple(pointer[1:].split(_SLASH)) if pointer else ()
+
+        # Pieces decoded for dict and list access when the evaluator is compiled, cleared whenever the pointer is moved
+        self.__dict_keys = None
+        self.__list_indices = None
+
+        # Cached string representation, hash and compiled evaluator, cleared whenever the pointer is moved
+        self.__str_cache = None
+        self.__hash_cache = None
+        self.__evaluator = None
+        self.__evaluation_count = 0
 
     def __eq__(self, other):
         """
-        Two JsonPointer instances are equal if their string representations are the same.
+        Two JsonPointer instances are equal if they are made up of the same pieces.
 
         :param other: The other JsonPointer instance being compared.
         :type other: JsonPointer
@@ -84,27 +152,41 @@ class JsonPointer(object):
         :return: True if the JsonPointer's are equal, False otherwise.
         :rtype: bool
         """
-        return str(self) == str(other)
+        return isinstance(other, JsonPointer) and tuple(self.__pieces) == tuple(other.__pieces)
+
+    def __ne__(self, other):
+        """
+        Python 2 does not derive != from ==, so it is defined here explicitly.
+
+        :param other: The other JsonPointer instance being compared.
+        :type other: JsonPointer
+
+        :return: True if the JsonPointer's are not equal, False otherwise.
+        :rtype: bool
+        """
+        return not self == other
 
     def __hash__(self):
         """
-        JsonPointer hashing is equivalent to the hash of the string representation of the pointer.
+        JsonPointer hashing is equivalent to the hash of the pointer's pieces.
 
         :return: The hash value of the JsonPointer.
         :rtype: int
         """
-        return str(self).__hash__()
+        if self.__hash_cache is None:
+            self.__hash_cache = hash(tuple(self.__pieces))
+
+        return self.__hash_cache
 
     def __str__(self):
         """
         :return: A nice string representation of the JsonPointer.
         :rtype: str
         """
-        string = self.__EMPTY_STR
-        for piece in self.__pieces:
-            string = "{}{}{}".format(string, self.__SLASH, piece)
+        if self.__str_cache is None:
+            self.__str_cache = _SLASH + _SLASH.join(self.__pieces) if self.__pieces else _EMPTY_STR
 
-        return string
+        return self.__str_cache
 
     #########################
     #
@@ -115,8 +197,8 @@ class JsonPointer(object):
         """
         Evaluates the JsonPointer against param obj.
 
-        :param obj: A dict of key/value pairs.
-        :type obj: dict
+        :param obj: A JSON-style object, such as a dict of key/value pairs or a list.
+        :type obj: dict or list
 
         :return: The attribute specified by the path attribute, or None if it doesn't exist.
         :rtype: any
@@ -124,23 +206,60 @@ class JsonPointer(object):
         :raises JsonPointerException: When the specified JSON pointer path does not resolve, either because the
             path does not exist within the dict or an out of bounds array index is specified.
         """
-        assert isinstance(obj, dict), 'obj parameter given not a dict'
+        # Fast path for the root pointer, which references the whole document
+        pieces = self.__pieces
+        if not pieces:
+            return obj
+
+        evaluator = self.__evaluator
+        if evaluator is None:
+            # Compiling only pays off once a pointer is evaluated repeatedly, so walk the pieces until then
+            self.__evaluation_count += 1
+            if self.__evaluation_count < _COMPILE_THRESHOLD:
+                return self.__evaluate_pieces(obj)
+            evaluator = self.__get_evaluator()
+
+        # Fast path for the most common pointer, a single key into a dict
+        if len(pieces) == 1 and type(obj) is dict:
+            try:
+                return obj[self.__dict_keys[0]]
+            except KeyError:
+                return self.__evaluate_pieces(obj)
+
+        try:
+            return evaluator(obj)
+        except _LOOKUP_ERRORS:
+            return self.__evaluate_pieces(obj)
+
+    def evaluate_many(self, objs):
+        """
+        Evaluates the JsonPointer against each object in param objs.
 
-        # Used for error reporting during array access failures
-        last_pointer_piece = None
+        --- Example ---
+
+        >>> pointer = JsonPointer('/foo')
+        >>> foos = pointer.evaluate_many([{'foo': 'bar'}, {'foo': 'baz'}])
+        >>> assert foos == ['bar', 'baz']
+
+        :param objs: An iterable of JSON-style objects.
+        :type objs: iterable
+
+        :return: The attribute specified by the path attribute for each object, in order.
+        :rtype: list
+
+        :raises JsonPointerException: When the specified JSON pointer path does not resolve for one of the objects.
+        """
+        evaluator = self.__get_evaluator()
 
-        for piece in self.__pieces:
+        results = []
+        append = results.append
+        for obj in objs:
             try:
-                obj = self.__access_attribute_from_object(piece, obj)
-            except (KeyError, TypeError, ValueError):
-                raise JsonPointerException('Could not use key "{}" to access JSON given pointer "{}"."'
-                                           .format(piece, str(self)))
-            except IndexError:
-                raise JsonPointerException('Array index "{}" out of bounds for array "{}" given pointer "{}".'
-                                           .format(piece, last_pointer_piece, str(self)))
-            last_pointer_piece = piece
+                append(evaluator(obj))
+            except _LOOKUP_ERRORS:
+                append(self.__evaluate_pieces(obj))
 
-        return obj
+        return results
 
     def move_pointer_forward(self, attribute):
         """
@@ -158,7 +277,10 @@ class JsonPointer(object):
         assert isinstance(attribute, str) or isinstance(attribute, int), \
             'attribute parameter given not a string or int.'
 
-        self.__pieces.append(str(attribute))
+        piece = str(attribute)
+
+        self.__prepare_move()
+        self.__pieces.append(piece)
 
     def move_pointer_backward(self):
         """
@@ -174,40 +296,173 @@ class JsonPointer(object):
             pointing to the root of the object.
         :rtype: str or None
         """
-        return self.__pieces.pop() if len(self.__pieces) > 0 else None
+        if len(self.__pieces) == 0:
+            return None
+
+        self.__prepare_move()
+        return self.__pieces.pop()
 
     #########################
     #
     # Helper Functions
     #
     #########################
-    def __access_attribute_from_object(self, key, obj):
+    def __prepare_move(self):
         """
-        Attempts to access the given key from param obj.
+        Clears everything derived from the pointer's pieces, and converts the pieces to a list
+        so that they can be appended to and popped from in place.
+        """
+        if type(self.__pieces) is tuple:
+            self.__pieces = list(self.__pieces)
+
+        self.__dict_keys = None
+        self.__list_indices = None
+        self.__str_cache = None
+        self.__hash_cache = None
+        self.__evaluator = None
+        self.__evaluation_count = 0
 
-        :param key: The value being used to key into the obj param.
-        :type key: str or int
+    def __evaluate_pieces(self, obj):
+        """
+        Evaluates the JsonPointer against param obj one piece at a time, decoding each piece as it is used.
+        Used until the pointer is hot enough to compile, and whenever the compiled evaluator fails, as this path
+        handles dict and list subclasses and raises descriptive errors.
 
-        :param obj: The list or dict object being keyed into by param key.
+        :param obj: A JSON-style object, such as a dict of key/value pairs or a list.
         :type obj: dict or list
 
-        :return: The object that has been accessed via param key.
-        :rtype: dict or list
-        """
-        if isinstance(obj, dict):
-            key = self.__revert_escaped_path_string(
-                unquote(key)
-            )
-        elif isinstance(obj, list):
-            if key == self.__DASH:
-                # Special case: '-' can be specified to access the final list element
-                key = len(obj) - 1
-            else:
-                if len(key) > 1 and key[0] == self.__ZERO:
+        :return: The attribute specified by the path attribute.
+        :rtype: any
+
+        :raises JsonPointerException: When the specified JSON pointer path does not resolve.
+        """
+        pieces = self.__pieces
+        # The decoded tables exist once the evaluator is compiled; before then pieces are decoded inline
+        dict_keys = self.__dict_keys
+        list_indices = self.__list_indices
+        array_index_match = _ARRAY_INDEX_RE.match
+
+        for i, piece in enumerate(pieces):
+            if isinstance(obj, dict):
+                if dict_keys is not None:
+                    key = dict_keys[i]
+                else:
+                    key = piece
+                    if _PERCENT in key:
+                        key = unquote(key)
+                    if _TILDE in key:
+                        key = key.replace(_ESCAPED_SLASH, _SLASH).replace(_ESCAPED_TILDE, _TILDE)
+
+                try:
+                    obj = obj[key]
+                    continue
+                except _LOOKUP_ERRORS:
+                    pass
+            elif isinstance(obj, list):
+                if list_indices is not None:
+                    key = list_indices[i]
+                elif piece == _DASH:
+                    key = -1
+                else:
+                    key = int(piece) if array_index_match(piece) else None
+
+                if key is not None:
+                    # Special case: '-' (stored as -1) can be specified to access the final list element
+                    if key < 0:
+                        key = len(obj) - 1
+
+                    if 0 <= key < len(obj):
+                        obj = obj[key]
+                        continue
+
+                    # The parent piece is only needed for error reporting, so look it up lazily
+                    raise JsonPointerException('Array index "{}" out of bounds for array "{}" given pointer "{}".'
+                                               .format(piece, pieces[i - 1] if i else None, str(self)))
+
+                if len(piece) > 1 and piece[0] == _ZERO:
                     raise JsonPointerException('Found a leading zero in pointer "{}".'.format(str(self)))
-                key = int(key)
+            else:
+                try:
+                    obj = obj[piece]
+                    continue
+                except _LOOKUP_ERRORS:
+                    pass
 
-        return obj[key]
+            raise JsonPointerException('Could not use key "{}" to access JSON given pointer "{}"."'
+                                       .format(piece, str(self)))
+
+        return obj
+
+    def __get_evaluator(self):
+        """
+        Retrieves a function specialized to this pointer which performs each access as straight-line code,
+        compiling it on first use.
+
+        A piece which is a valid array index is used as an int if the object being accessed is exactly a list,
+        and as a str key otherwise. All other pieces are used as str keys, decoded only when the object being
+        accessed is a dict, matching the per-piece path.
+
+        :return: A function taking a JSON-style object and returning the attribute the pointer references.
+            It raises LookupError, TypeError or ValueError when the pointer does not resolve.
+        :rtype: function
+        """
+        if self.__evaluator is None:
+            if self.__dict_keys is None:
+                self.__decode_pieces()
+
+            # Builtins are bound as defaults so the generated code reads them as fast locals
+            lines = ['def evaluate(obj, type=type, list=list, isinstance=isinstance, dict=dict):']
+            for piece, key, index in zip(self.__pieces, self.__dict_keys, self.__list_indices):
+                if index is None and key != piece:
+                    lines.append('    obj = obj[{!r}] if isinstance(obj, dict) else obj[{!r}]'.format(key, piece))
+                elif index is None:
+                    lines.append('    obj = obj[{!r}]'.format(key))
+                else:
+                    lines.append('    obj = obj[{!r}] if type(obj) is list else obj[{!r}]'.format(index, key))
+            lines.append('    return obj')
+
+            namespace = {}
+            exec(compile('\n'.join(lines), '<json_pointer>', 'exec'), namespace)
+            self.__evaluator = namespace['evaluate']
+
+        return self.__evaluator
+
+    def __decode_pieces(self):
+        """
+        Decodes every pointer piece into the key used to access a dict and the index used to access a list.
+        """
+        self.__dict_keys = tuple(self.__decode_dict_key(piece) for piece in self.__pieces)
+        self.__list_indices = tuple(self.__decode_list_index(piece) for piece in self.__pieces)
+
+    def __decode_dict_key(self, piece):
+        """
+        Converts a pointer piece into the key used to access a dict.
+
+        :param piece: The raw pointer piece.
+        :type piece: str
+
+        :return: The piece with URI fragment encoding and escaped characters reverted.
+        :rtype: str
+        """
+        if _PERCENT in piece:
+            piece = unquote(piece)
+
+        return self.__revert_escaped_path_string(piece)
+
+    def __decode_list_index(self, piece):
+        """
+        Converts a pointer piece into the index used to access a list.
+
+        :param piece: The raw pointer piece.
+        :type piece: str
+
+        :return: The integer index, -1 for the '-' special case, or None if the piece is not a valid array index.
+        :rtype: int or None
+        """
+        if piece == _DASH:
+            return -1
+
+        return int(piece) if _ARRAY_INDEX_RE.match(piece) else None
 
     def __escape_path_string(self, string):
         """
@@ -219,7 +474,10 @@ class JsonPointer(object):
         :return: The equivalent path string with slashes and tildes escaped.
         :rtype: str
         """
-        return string.replace(self.__TILDE, self.__ESCAPED_TILDE).replace(self.__SLASH, self.__ESCAPED_SLASH)
+        if _TILDE not in string and _SLASH not in string:
+            return string
+
+        return string.replace(_TILDE, _ESCAPED_TILDE).replace(_SLASH, _ESCAPED_SLASH)
 
     def __revert_escaped_path_string(self, string):
         """
@@ -232,7 +490,10 @@ class JsonPointer(object):
         :return: The equivalent path string with escaped slashes and tildes reverted.
         :rtype: str
         """
-        return string.replace(self.__ESCAPED_SLASH, self.__SLASH).replace(self.__ESCAPED_TILDE, self.__TILDE)
+        if _TILDE not in string:
+            return string
+
+        return string.replace(_ESCAPED_SLASH, _SLASH).replace(_ESCAPED_TILDE, _TILDE)
 
     def __validate_pointer(self, pointer):
         """
@@ -247,7 +508,7 @@ class JsonPointer(object):
         if not isinstance(pointer, str):
             raise JsonPointerException('Pointer parameter "{}" given not a string,'.format(pointer))
 
-        if pointer != self.__EMPTY_STR and pointer[0] != self.__SLASH:
+        if pointer != _EMPTY_STR and pointer[0] != _SLASH:
             raise JsonPointerException('Path "{}" given not in correct JSON pointer format.'.format(pointer))
 
 
@@ -1,6 +1,7 @@
 import unittest
 import json
 import os
+import json_pointer
 from json_pointer import evaluate, JsonPointerException
 from tests import TEST_DIR
 
@@ -27,6 +28,8 @@ class EvaluateTest(unittest.TestCase):
         self.assertEqual(evaluate('/ ', self.json), 7)
         self.assertEqual(evaluate('/m~0n', self.json), 8)
         self.assertEqual(evaluate('/0/1', self.json), 9)
+        self.assertEqual(evaluate('/~01', {'~1': 10}), 10)
+        self.assertEqual(evaluate('/1/0', [None, ['bar']]), 'bar')
 
         # Testing URI Fragments
         self.assertEqual(evaluate('/c%25d', self.json), 2)
@@ -36,9 +39,35 @@ class EvaluateTest(unittest.TestCase):
         self.assertEqual(evaluate('/k%22l', self.json), 6)
         self.assertEqual(evaluate('/%20', self.json), 7)
 
+    def test_evaluate_repeated(self):
+        pointer = json_pointer._get_pointer('/foo/0')
+        self.assertIs(json_pointer._get_pointer('/foo/0'), pointer)
+
+        self.assertEqual(evaluate('/foo/0', self.json), 'bar')
+        self.assertEqual(evaluate('/foo/0', {'foo': ['qux']}), 'qux')
+        self.assertRaises(JsonPointerException, evaluate, '/foo/0', {'foo': []})
+
+    def test_evaluate_cache_eviction(self):
+        cache_size = json_pointer._POINTER_CACHE_SIZE
+        self.addCleanup(setattr, json_pointer, '_POINTER_CACHE_SIZE', cache_size)
+        json_pointer._POINTER_CACHE_SIZE = 2
+        json_pointer._POINTER_CACHE.clear()
+
+        pointers = ['/a', '/b', '/c', '/d']
+        for pointer in pointers:
+            self.assertEqual(evaluate(pointer, {pointer[1:]: pointer}), pointer)
+            self.assertLessEqual(len(json_pointer._POINTER_CACHE), 2)
+
+        self.assertIn('/d', json_pointer._POINTER_CACHE)
+
     def test_evaluate_negatives(self):
         self.assertRaises(JsonPointerException, evaluate, '/foo/22', self.json)
         self.assertRaises(JsonPointerException, evaluate, '/unresolvable', self.json)
         self.assertRaises(JsonPointerException, evaluate, '/foo/unresolvable', self.json)
         self.assertRaises(JsonPointerException, evaluate, 'garbage', self.json)
+        self.assertRaises(JsonPointerException, evaluate, 0, self.json)
+        self.assertRaises(JsonPointerException, evaluate, '/foo', None)
         self.assertRaises(JsonPointerException, evaluate, '/foo/000001', self.json)
+        self.assertRaises(JsonPointerException, evaluate, '/foo/-1', self.json)
+        self.assertRaises(JsonPointerException, evaluate, '/foo/+1', self.json)
+        self.assertRaises(JsonPointerException, evaluate, '/foo/ 1', self.json)
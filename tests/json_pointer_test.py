@@ -1,6 +1,6 @@
 import unittest
 
-from json_pointer import JsonPointer, JsonPointerException
+from json_pointer import JsonPointer, JsonPointerException, _COMPILE_THRESHOLD
 
 
 class JsonPointerTest(unittest.TestCase):
@@ -28,14 +28,88 @@ class JsonPointerTest(unittest.TestCase):
         self.assertEqual(attr, None)
         self.assertEqual(str(self.pointer), '')
 
+    def test_evaluate_after_move(self):
+        obj = {'foo': ['bar', {'a/b': 'baz'}]}
+
+        self.pointer.move_pointer_forward('a~1b')
+        self.assertEqual(self.pointer.evaluate(obj), 'baz')
+
+        self.pointer.move_pointer_backward()
+        self.pointer.move_pointer_backward()
+        self.pointer.move_pointer_forward('-')
+        self.assertEqual(self.pointer.evaluate(obj), {'a/b': 'baz'})
+
+    def test_evaluate_list_subclass(self):
+        class JsonList(list):
+            pass
+
+        self.assertEqual(self.pointer.evaluate({'foo': JsonList(['bar', 'baz'])}), 'baz')
+        self.assertRaises(JsonPointerException, self.pointer.evaluate, {'foo': JsonList(['bar'])})
+
+    def test_evaluate_repeated(self):
+        obj = {'foo': ['bar', 'baz']}
+        for _ in range(3):
+            self.assertEqual(self.pointer.evaluate(obj), 'baz')
+            self.assertRaises(JsonPointerException, self.pointer.evaluate, {'foo': ['bar']})
+
+    def test_evaluate_custom_mapping(self):
+        class Mapping(object):
+            def __init__(self, items):
+                self.items = items
+
+            def __getitem__(self, key):
+                return self.items[key]
+
+        for pointer in ('/a~1b', '/a%20b'):
+            json_pointer = JsonPointer(pointer)
+            for _ in range(_COMPILE_THRESHOLD + 1):
+                self.assertEqual(json_pointer.evaluate(Mapping({pointer[1:]: 1})), 1)
+                self.assertRaises(JsonPointerException, json_pointer.evaluate, Mapping({'a/b': 1, 'a b': 1}))
+
+    def test_evaluate_value_error(self):
+        class ValueErrorMapping(object):
+            def __getitem__(self, key):
+                raise ValueError(key)
+
+        pointer = JsonPointer('/a/b')
+        for _ in range(3):
+            self.assertRaises(JsonPointerException, pointer.evaluate, {'a': ValueErrorMapping()})
+        self.assertRaises(JsonPointerException, pointer.evaluate_many, [{'a': ValueErrorMapping()}])
+
+        class ValueErrorDict(dict):
+            def __getitem__(self, key):
+                raise ValueError(key)
+
+        for _ in range(3):
+            self.assertRaises(JsonPointerException, pointer.evaluate, ValueErrorDict())
+            self.assertRaises(JsonPointerException, pointer.evaluate, {'a': ValueErrorDict()})
+        self.assertRaises(JsonPointerException, pointer.evaluate_many, [{'a': ValueErrorDict()}])
+
+    def test_evaluate_many(self):
+        objs = [{'foo': ['bar', 'baz']}, {'foo': {'1': 'qux'}}]
+        self.assertEqual(self.pointer.evaluate_many(objs), ['baz', 'qux'])
+        self.assertEqual(self.pointer.evaluate_many([]), [])
+        self.assertRaises(JsonPointerException, self.pointer.evaluate_many, [{'foo': ['bar']}])
+
     def test_equals(self):
         self.assertTrue(self.pointer == JsonPointer('/foo/1'))
         self.assertFalse(self.pointer == JsonPointer('/foo'))
+        self.assertFalse(self.pointer == '/foo/1')
+        self.assertFalse(self.pointer != JsonPointer('/foo/1'))
+        self.assertTrue(self.pointer != JsonPointer('/foo'))
+        self.assertTrue(self.pointer != '/foo/1')
+
+        self.pointer.move_pointer_forward('baz')
+        self.assertTrue(self.pointer == JsonPointer('/foo/1/baz'))
+        self.assertTrue(JsonPointer('/foo/1/baz') == self.pointer)
 
     def test_hash(self):
         self.assertTrue(self.pointer.__hash__() == JsonPointer('/foo/1').__hash__())
         self.assertFalse(self.pointer.__hash__() == JsonPointer('/foo').__hash__())
 
+        self.pointer.move_pointer_backward()
+        self.assertTrue(self.pointer.__hash__() == JsonPointer('/foo').__hash__())
+
     def test_init_validation(self):
         self.assertRaises(JsonPointerException, JsonPointer, 0)
         self.assertRaises(JsonPointerException, JsonPointer, 'invalid')